@@ -7,10 +7,38 @@ import time
 from pathlib import Path
 import logging
 
+import numpy as np
+
 from collectors.prometheus_collector import PrometheusCollector
 from models.traffic_modeler import TrafficModeler
 from utils.logger import setup_logger
 
+# orjson serializes the model (including any ndarray fields) far faster
+# than stdlib json's indent mode; fall back to json when not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _np_default(obj):
+    """json.dump fallback serializer for NumPy scalars and arrays"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+def _write_model(output_path: Path, model: dict):
+    """Write the model as indented JSON using the fastest available writer"""
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(
+            model,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(model, f, indent=2, default=_np_default)
+
 def main():
     """Main entry point for Python analysis component"""
     parser = argparse.ArgumentParser(
@@ -68,35 +96,33 @@ def run_learn(args):
     start_time = time.time()
     
     try:
-        # 1. Test Prometheus connection
+        # 1. Collect metrics (connection errors surface from the fetch itself,
+        # avoiding a separate pre-flight round-trip)
         logger.info(f"🔗 Connecting to Prometheus at {args.prometheus}")
-        collector = PrometheusCollector(args.prometheus)
-        
-        if not collector.test_connection():
-            logger.error(f"❌ Cannot connect to Prometheus at {args.prometheus}")
-            logger.error("   Please check the URL and ensure Prometheus is running")
-            return 1
-        
-        logger.info("✅ Prometheus connection successful")
-        
-        # 2. Collect metrics
-        logger.info(f"📊 Fetching metric: {args.metric}")
-        logger.info(f"   Duration: {args.duration}, Step: {args.step}s")
-        
-        traffic_data = collector.fetch_metrics(args.metric, args.duration, args.step)
+
+        with PrometheusCollector(args.prometheus) as collector:
+            logger.info(f"📊 Fetching metric: {args.metric}")
+            logger.info(f"   Duration: {args.duration}, Step: {args.step}s")
+
+            try:
+                traffic_data = collector.fetch_metrics(args.metric, args.duration, args.step)
+            except ConnectionError:
+                logger.error(f"❌ Cannot connect to Prometheus at {args.prometheus}")
+                logger.error("   Please check the URL and ensure Prometheus is running")
+                return 1
         
         logger.info(f"✅ Collected {len(traffic_data['values'])} data points")
         logger.info(f"   Time range: {traffic_data['start_time']} to {traffic_data['end_time']}")
         
-        # 3. Validate data quality
-        values = traffic_data['values']
+        # 2. Validate data quality
+        values = np.asarray(traffic_data['values'])
         if len(values) < 50:
             logger.warning(f"⚠️  Low data point count ({len(values)}). Consider longer duration or smaller step.")
-        
-        if all(v == 0 for v in values):
+
+        if not np.any(values):
             logger.warning("⚠️  All values are zero. Check metric name and time range.")
         
-        # 4. Analyze patterns
+        # 3. Analyze patterns
         logger.info("🧠 Analyzing traffic patterns...")
         modeler = TrafficModeler(
             wavelet_type=args.wavelet,
@@ -105,25 +131,24 @@ def run_learn(args):
         
         model = modeler.model(traffic_data)
         
-        # 5. Validate model
+        # 4. Validate model
         warnings = modeler.validate_model(model)
         if warnings:
             logger.warning("⚠️  Model validation warnings:")
             for warning in warnings:
                 logger.warning(f"   • {warning}")
         
-        # 6. Add timing metadata
+        # 5. Add timing metadata
         analysis_duration = (time.time() - start_time) * 1000
         model['metadata']['analysis_duration_ms'] = analysis_duration
         
-        # 7. Save model
+        # 6. Save model
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            json.dump(model, f, indent=2)
+        _write_model(output_path, model)
         
-        # 8. Display results summary
+        # 7. Display results summary
         logger.info(f"💾 Model saved to {args.output}")
         logger.info(f"⚡ Analysis completed in {analysis_duration:.0f}ms")
         
@@ -1,9 +1,48 @@
 import numpy as np
 from scipy import stats
+from scipy.signal import resample_poly
 from sklearn.cluster import DBSCAN
 from typing import Dict, List, Any, Tuple
 import logging
 
+# Optional numba JIT for the cluster gap scan over spike timestamps
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+if _HAVE_NUMBA:
+    @njit(cache=True)
+    def _cluster_boundaries(timestamps, max_gap_ms):
+        """Indices where the gap to the previous spike exceeds max_gap_ms"""
+        out = np.empty(len(timestamps), dtype=np.int64)
+        k = 0
+        for i in range(1, len(timestamps)):
+            if timestamps[i] - timestamps[i - 1] > max_gap_ms:
+                out[k] = i
+                k += 1
+        return out[:k]
+else:
+    def _cluster_boundaries(timestamps, max_gap_ms):
+        """Indices where the gap to the previous spike exceeds max_gap_ms"""
+        return np.flatnonzero(np.diff(timestamps) > max_gap_ms) + 1
+
+def _resample_to(detail: np.ndarray, target_length: int) -> np.ndarray:
+    """Upsample a detail coefficient band to target_length
+
+    Polyphase FIR resampling reconstructs the band in one C-level pass,
+    unlike np.interp's per-point searchsorted, and is a proper low-pass
+    interpolator rather than a linear one.
+    """
+    if len(detail) == target_length:
+        return detail
+
+    resampled = resample_poly(detail, up=target_length, down=len(detail))
+    if len(resampled) < target_length:
+        resampled = np.pad(resampled, (0, target_length - len(resampled)), mode='edge')
+    return resampled[:target_length]
+
 class SpikeDetector:
     """Detects and analyzes traffic spikes in time series data"""
     
@@ -49,7 +88,8 @@ class SpikeDetector:
         # Analyze spike distribution
         distribution = self._analyze_spike_distribution(clustered_spikes)
         
-        self.logger.debug(f'Detected {len(clustered_spikes)} spike events')
+        # %-style args defer formatting until the level check passes
+        self.logger.debug('Detected %d spike events', len(clustered_spikes))
         
         return {
             'threshold': float(threshold),
@@ -59,34 +99,48 @@ class SpikeDetector:
     
     def _calculate_statistics(self, signal: np.ndarray) -> Dict[str, float]:
         """Calculate comprehensive signal statistics"""
+        # One batched quantile call partitions the signal once instead of
+        # three times, and std comes from var instead of a second pass
+        p50, p95, p99 = np.quantile(signal, [0.5, 0.95, 0.99])
+        variance = float(signal.var())
+
         return {
-            'mean': float(np.mean(signal)),
-            'std': float(np.std(signal)),
-            'variance': float(np.var(signal)),
-            'p50': float(np.percentile(signal, 50)),
-            'p95': float(np.percentile(signal, 95)),
-            'p99': float(np.percentile(signal, 99)),
-            'min': float(np.min(signal)),
-            'max': float(np.max(signal))
+            'mean': float(signal.mean()),
+            'std': float(np.sqrt(variance)),
+            'variance': variance,
+            'p50': float(p50),
+            'p95': float(p95),
+            'p99': float(p99),
+            'min': float(signal.min()),
+            'max': float(signal.max())
         }
     
-    def _detect_direct_spikes(self, signal: np.ndarray, threshold: float, 
+    def _detect_direct_spikes(self, signal: np.ndarray, threshold: float,
                             stats: Dict[str, float]) -> List[Dict[str, Any]]:
         """Detect spikes directly from signal values"""
-        spikes = []
-        
-        for i, value in enumerate(signal):
-            if value > threshold:
-                spike = {
-                    'index': i,
-                    'timestamp': i * 60 * 1000,  # Convert to milliseconds (assuming 1min intervals)
-                    'magnitude': float(value),
-                    'deviation': float((value - stats['mean']) / stats['std']) if stats['std'] > 0 else 0,
-                    'method': 'direct'
-                }
-                spikes.append(spike)
-        
-        return spikes
+        # Boolean mask in C instead of a Python comparison per sample;
+        # only the (typically few) spike samples reach Python
+        indices = np.flatnonzero(signal > threshold)
+        if len(indices) == 0:
+            return []
+
+        magnitudes = signal[indices]
+        if stats['std'] > 0:
+            deviations = (magnitudes - stats['mean']) / stats['std']
+        else:
+            deviations = np.zeros(len(indices))
+
+        return [
+            {
+                'index': int(i),
+                'timestamp': int(i) * 60 * 1000,  # Convert to milliseconds (assuming 1min intervals)
+                'magnitude': float(value),
+                'deviation': float(deviation),
+                'method': 'direct'
+            }
+            for i, value, deviation in zip(indices.tolist(), magnitudes.tolist(),
+                                           deviations.tolist())
+        ]
     
     def _combine_detail_coefficients(self, detail_coeffs: List[np.ndarray], 
                                    target_length: int) -> np.ndarray:
@@ -96,22 +150,18 @@ class SpikeDetector:
         
         # Start with the highest frequency detail (last coefficient)
         combined = np.zeros(target_length)
-        
+
         for level, detail in enumerate(detail_coeffs):
             if len(detail) == 0:
                 continue
-                
+
             # Upsample detail coefficient to match target length
-            upsampled = np.interp(
-                np.linspace(0, 1, target_length),
-                np.linspace(0, 1, len(detail)),
-                detail
-            )
-            
+            upsampled = _resample_to(np.asarray(detail), target_length)
+
             # Weight higher frequency components more
             weight = 2 ** level
             combined += weight * upsampled
-        
+
         return combined
     
     def _detect_wavelet_spikes(self, high_freq_signal: np.ndarray, 
@@ -129,24 +179,35 @@ class SpikeDetector:
         if hf_std == 0:
             return spikes
         
-        # Use adaptive threshold based on signal characteristics
-        hf_threshold = hf_mean + self.threshold_sigma * hf_std
-        
-        for i, hf_value in enumerate(high_freq_signal):
-            if abs(hf_value) > abs(hf_threshold):
-                # Check if this corresponds to an actual spike in original signal
-                if i < len(original_signal):
-                    spike = {
-                        'index': i,
-                        'timestamp': i * 60 * 1000,
-                        'magnitude': float(original_signal[i]),
-                        'hf_magnitude': float(hf_value),
-                        'deviation': float(hf_value / hf_std) if hf_std > 0 else 0,
-                        'method': 'wavelet'
-                    }
-                    spikes.append(spike)
-        
-        return spikes
+        # Use adaptive threshold based on signal characteristics; a single
+        # boolean mask replaces the per-sample Python comparison, and the
+        # abs(threshold) is computed once instead of per iteration
+        threshold_abs = abs(hf_mean + self.threshold_sigma * hf_std)
+        mask = np.abs(high_freq_signal) > threshold_abs
+
+        # Only positions that exist in the original signal can be spikes
+        mask[len(original_signal):] = False
+        indices = np.flatnonzero(mask)
+        if len(indices) == 0:
+            return spikes
+
+        hf_values = high_freq_signal[indices]
+        magnitudes = original_signal[indices]
+        deviations = hf_values / hf_std
+
+        return [
+            {
+                'index': int(i),
+                'timestamp': int(i) * 60 * 1000,
+                'magnitude': float(magnitude),
+                'hf_magnitude': float(hf_value),
+                'deviation': float(deviation),
+                'method': 'wavelet'
+            }
+            for i, magnitude, hf_value, deviation in zip(
+                indices.tolist(), magnitudes.tolist(),
+                hf_values.tolist(), deviations.tolist())
+        ]
     
     def _cluster_spikes(self, spikes: List[Dict[str, Any]], 
                        max_gap_minutes: int = 10) -> List[Dict[str, Any]]:
@@ -156,43 +217,47 @@ class SpikeDetector:
         
         # Sort spikes by timestamp
         sorted_spikes = sorted(spikes, key=lambda x: x['timestamp'])
-        
-        # Group spikes by proximity
-        clusters = []
-        current_cluster = [sorted_spikes[0]]
-        
-        for spike in sorted_spikes[1:]:
-            time_gap = (spike['timestamp'] - current_cluster[-1]['timestamp']) / (60 * 1000)  # minutes
-            
-            if time_gap <= max_gap_minutes:
-                current_cluster.append(spike)
-            else:
-                clusters.append(current_cluster)
-                current_cluster = [spike]
-        
-        clusters.append(current_cluster)
-        
-        # Merge each cluster into a single event
+
+        # Find cluster boundaries with one native scan over the timestamp
+        # array instead of a Python comparison per spike
+        timestamps = np.fromiter((s['timestamp'] for s in sorted_spikes),
+                                 dtype=np.int64, count=len(sorted_spikes))
+        magnitudes = np.fromiter((s['magnitude'] for s in sorted_spikes),
+                                 dtype=np.float64, count=len(sorted_spikes))
+        boundaries = _cluster_boundaries(timestamps, max_gap_minutes * 60 * 1000)
+
+        # Merge each boundary-delimited cluster into a single event;
+        # slicing the prebuilt arrays avoids rebuilding lists from the
+        # spike dicts per cluster
         events = []
-        for cluster in clusters:
-            events.append(self._merge_spike_cluster(cluster))
-        
+        start = 0
+        for end in [*boundaries.tolist(), len(sorted_spikes)]:
+            events.append(self._merge_spike_cluster(
+                sorted_spikes[start:end],
+                magnitudes[start:end],
+                timestamps[start:end]
+            ))
+            start = end
+
         return events
     
-    def _merge_spike_cluster(self, cluster: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Merge a cluster of spikes into a single event"""
+    def _merge_spike_cluster(self, cluster: List[Dict[str, Any]],
+                             magnitudes: np.ndarray,
+                             timestamps: np.ndarray) -> Dict[str, Any]:
+        """Merge a cluster of spikes into a single event
+
+        magnitudes and timestamps are the cluster's slices of the arrays
+        built in _cluster_spikes; timestamps are sorted ascending.
+        """
         if len(cluster) == 1:
             return self._format_spike_event(cluster[0])
-        
-        # Calculate cluster statistics
-        magnitudes = [spike['magnitude'] for spike in cluster]
-        timestamps = [spike['timestamp'] for spike in cluster]
-        
+
         # Use peak magnitude and median timestamp
-        peak_magnitude = max(magnitudes)
-        total_magnitude = sum(magnitudes)
+        peak_magnitude = float(magnitudes.max())
+        total_magnitude = float(magnitudes.sum())
         median_timestamp = int(np.median(timestamps))
-        duration_minutes = (max(timestamps) - min(timestamps)) / (60 * 1000)
+        # Sorted, so the span is last minus first
+        duration_minutes = (timestamps[-1] - timestamps[0]) / (60 * 1000)
         
         return {
             'timestamp': median_timestamp,
@@ -243,10 +308,7 @@ class SpikeDetector:
         try:
             # Fit exponential distribution
             lambda_param = 1 / mean_interval if mean_interval > 0 else 1
-            
-            # Generate expected exponential distribution
-            expected_intervals = np.random.exponential(mean_interval, len(intervals))
-            
+
             # Simple distribution classification
             cv = np.std(intervals) / mean_interval if mean_interval > 0 else float('inf')
             
@@ -1,9 +1,42 @@
 import numpy as np
 from typing import List, Tuple
 
+# Optional numba JIT for the branch-heavy peak scan; the vectorized
+# NumPy comparison serves as the fallback
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+if _HAVE_NUMBA:
+    @njit(cache=True)
+    def _find_peaks_core(signal, threshold):
+        out = np.empty(len(signal), dtype=np.int64)
+        k = 0
+        for i in range(1, len(signal) - 1):
+            if (signal[i] > signal[i - 1] and
+                    signal[i] > signal[i + 1] and
+                    signal[i] > threshold):
+                out[k] = i
+                k += 1
+        return out[:k]
+else:
+    def _find_peaks_core(signal, threshold):
+        if len(signal) < 3:
+            return np.empty(0, dtype=np.int64)
+        interior = signal[1:-1]
+        mask = (interior > signal[:-2]) & (interior > signal[2:]) & (interior > threshold)
+        return np.flatnonzero(mask) + 1
+
 def calculate_energy(signal: np.ndarray) -> float:
-    """Calculate signal energy (sum of squares)"""
-    return float(np.sum(signal ** 2))
+    """Calculate signal energy (sum of squares)
+
+    np.dot hits the BLAS dot kernel without materializing the signal**2
+    temporary, halving memory traffic versus np.sum(signal ** 2).
+    """
+    signal = np.asarray(signal)
+    return float(np.dot(signal, signal))
 
 def normalize_signal(signal: np.ndarray) -> np.ndarray:
     """Normalize signal to zero mean and unit variance"""
@@ -15,13 +48,8 @@ def normalize_signal(signal: np.ndarray) -> np.ndarray:
 
 def find_peaks_simple(signal: np.ndarray, threshold: float = 0.5) -> List[int]:
     """Find simple peaks in signal above threshold"""
-    peaks = []
-    for i in range(1, len(signal) - 1):
-        if (signal[i] > signal[i-1] and 
-            signal[i] > signal[i+1] and 
-            signal[i] > threshold):
-            peaks.append(i)
-    return peaks
+    signal = np.ascontiguousarray(signal, dtype=np.float64)
+    return _find_peaks_core(signal, threshold).tolist()
 
 def smooth_signal(signal: np.ndarray, window_size: int = 5) -> np.ndarray:
     """Apply simple moving average smoothing"""
@@ -33,19 +61,23 @@ def smooth_signal(signal: np.ndarray, window_size: int = 5) -> np.ndarray:
 
 def pad_to_power_of_two(signal: np.ndarray) -> Tuple[np.ndarray, int]:
     """Pad signal to next power of 2 for FFT efficiency
-    
+
+    The target size comes from integer bit math (exact, no float
+    rounding) and the output is filled directly rather than going
+    through np.pad's extra allocation. Dtype is preserved.
+
     Returns:
         Tuple of (padded_signal, original_length)
     """
     original_length = len(signal)
-    next_power = 2 ** int(np.ceil(np.log2(original_length)))
-    
+    next_power = 1 << (original_length - 1).bit_length() if original_length > 0 else 1
+
     if next_power == original_length:
         return signal, original_length
-    
+
     # Pad with last value to avoid discontinuities
-    last_value = signal[-1] if len(signal) > 0 else 0
-    padded = np.pad(signal, (0, next_power - original_length), 
-                   mode='constant', constant_values=last_value)
-    
+    padded = np.empty(next_power, dtype=signal.dtype)
+    padded[:original_length] = signal
+    padded[original_length:] = signal[-1] if original_length > 0 else 0
+
     return padded, original_length
\ No newline at end of file
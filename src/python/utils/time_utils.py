@@ -1,35 +1,42 @@
 import re
-from typing import int
+from functools import lru_cache
 
+_DURATION_RE = re.compile(r'^(\d+)([hdwm])$')
+
+_MULTIPLIERS = {
+    'h': 3600,      # hours
+    'd': 86400,     # days
+    'w': 604800,    # weeks
+    'm': 2592000    # months (30 days)
+}
+
+@lru_cache(maxsize=128)
 def parse_duration(duration: str) -> int:
     """Parse duration string into seconds
-    
+
     Args:
         duration: Duration string like '7d', '24h', '30m'
-        
+
     Returns:
         Duration in seconds
-        
+
     Raises:
         ValueError: If duration format is invalid
     """
-    pattern = r'^(\d+)([hdwm])$'
-    match = re.match(pattern, duration.lower())
-    
+    # Fast path for the common well-formed case ('7d', '24h', ...):
+    # plain slicing beats a regex match
+    unit = duration[-1:].lower()
+    if unit in _MULTIPLIERS and duration[:-1].isdigit():
+        return int(duration[:-1]) * _MULTIPLIERS[unit]
+
+    match = _DURATION_RE.match(duration.lower())
+
     if not match:
         raise ValueError(f'Invalid duration format: {duration}. Use: 1h, 7d, 1w, etc.')
-    
+
     value, unit = match.groups()
-    value = int(value)
-    
-    multipliers = {
-        'h': 3600,      # hours
-        'd': 86400,     # days  
-        'w': 604800,    # weeks
-        'm': 2592000    # months (30 days)
-    }
-    
-    return value * multipliers[unit]
+
+    return int(value) * _MULTIPLIERS[unit]
 
 def seconds_to_minutes(seconds: int) -> float:
     """Convert seconds to minutes"""